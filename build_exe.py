@@ -2,34 +2,330 @@
 
 from __future__ import annotations
 
-import base64
-import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import importlib.metadata
+import json
 from pathlib import Path
 import os
+import shutil
+import struct
 import subprocess
 import sys
+import sysconfig
 import tempfile
+import time
+import urllib.error
 import urllib.request
 
-from icon_data import ICON_BASE64
-
 FONT_DOWNLOAD_URL = "https://github.com/dejavu-fonts/dejavu-fonts/raw/master/ttf/DejaVuSans.ttf"
+APP_NAME = "Combine Json to Excel"
+# Set PYINSTALLER_BUILD_ONEFILE=1 to get a single self-extracting .exe instead
+# of the default folder bundle (e.g. for CI artifacts that must be one file).
+ONEFILE_ENV_VAR = "PYINSTALLER_BUILD_ONEFILE"
+# UPX is off by default; CURATORS_BUILD_UPX=1 turns it back on when download
+# size matters more than startup time.
+UPX_ENV_VAR = "CURATORS_BUILD_UPX"
+# CURATORS_BUILD_FORCE=1 runs PyInstaller even when the bundle looks current.
+FORCE_ENV_VAR = "CURATORS_BUILD_FORCE"
+# A cached font younger than this is used without contacting the server; an
+# older one is revalidated with a conditional request.
+FONT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# PyInstaller 6.6 added --optimize for compiling the collected modules.
+OPTIMIZE_FLAG_MIN_VERSION = (6, 6)
+SLOW_PEFILE_VERSION = "2024.8.26"
+# Arguments that are the same for every build, prepared once per process.
+BASE_PYINSTALLER_ARGS = tuple(map(sys.intern, ("--noconfirm", "--windowed", "--name", APP_NAME)))
+ONEFILE_ARG = sys.intern("--onefile")
+ONEDIR_ARG = sys.intern("--onedir")
+# --add-data source/destination pair suffix: bundle root, platform separator.
+DATA_TARGET = os.pathsep + "."
+
+
+def is_installed(distribution: str) -> bool:
+    # Reading the distribution metadata avoids importing the package itself.
+    try:
+        importlib.metadata.distribution(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
 
 
+def pip_install(*args: str) -> None:
+    # No preexec_fn, user or group changes, so on Linux subprocess can start
+    # pip with vfork() instead of a full fork() of this process.
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--quiet",
+            "--disable-pip-version-check",
+            "--no-input",
+            *args,
+        ],
+        check=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def ensure_pyinstaller() -> None:
     """Install PyInstaller on demand so the build works out of the box."""
 
-    if importlib.util.find_spec("PyInstaller") is None:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    if not is_installed("pyinstaller"):
+        pip_install("pyinstaller")
+    if sys.platform == "win32":
+        ensure_fast_pefile()
+
+
+def ensure_fast_pefile() -> None:
+    """Replace the pefile release that makes Windows builds take many times longer.
+
+    pefile 2024.8.26 slows down PyInstaller's binary analysis dramatically
+    (pyinstaller/pyinstaller#8762), so fall back to the previous release when
+    it is what got installed.
+    """
+
+    try:
+        installed = importlib.metadata.version("pefile")
+    except importlib.metadata.PackageNotFoundError:
+        return
+    if installed == SLOW_PEFILE_VERSION:
+        pip_install(f"pefile<{SLOW_PEFILE_VERSION}")
+
+
+def font_metadata_path(font_path: Path) -> Path:
+    return font_path.with_name(font_path.name + ".json")
+
+
+def load_font_metadata(font_path: Path) -> dict:
+    try:
+        metadata = json.loads(font_metadata_path(font_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def save_font_metadata(font_path: Path, metadata: dict) -> None:
+    try:
+        font_metadata_path(font_path).write_text(json.dumps(metadata), encoding="utf-8")
+    except OSError:
+        # The sidecar only saves bandwidth on later builds; losing it is harmless.
+        pass
+
+
+def font_cache_is_fresh(font_path: Path) -> bool:
+    checked_at = load_font_metadata(font_path).get("checked_at")
+    return isinstance(checked_at, (int, float)) and time.time() - checked_at < FONT_CACHE_MAX_AGE
+
+
+def stream_to_file(source, fp) -> str:
+    """Copy a response body to ``fp`` through one reused buffer.
+
+    shutil.copyfileobj allocates a new bytes object per chunk; reading into a
+    preallocated buffer avoids that copy. sendfile does not apply here since
+    the source is usually a TLS socket. Returns the SHA-256 of the data.
+    """
 
+    digest = hashlib.sha256()
+    buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+    while True:
+        size = source.readinto(buffer)
+        if not size:
+            break
+        digest.update(buffer[:size])
+        fp.write(buffer[:size])
+    return digest.hexdigest()
+
+
+def looks_like_truetype(data: bytes) -> bool:
+    """Check for the TrueType magic and a table directory that fits the file.
+
+    A truncated download loses the tail of the file, so some table then
+    points past its end.
+    """
+
+    if len(data) < 12 or data[:4] != b"\x00\x01\x00\x00":
+        return False
+    (num_tables,) = struct.unpack_from(">H", data, 4)
+    if not num_tables or 12 + 16 * num_tables > len(data):
+        return False
+    for index in range(num_tables):
+        offset, length = struct.unpack_from(">II", data, 12 + 16 * index + 8)
+        if offset + length > len(data):
+            return False
+    return True
+
+
+def font_cache_is_intact(font_path: Path) -> bool:
+    """Check the cached font against the digest recorded when it was downloaded.
+
+    Fonts cached before digests were recorded have none. Such a copy is only
+    trusted, and its digest recorded, if it is a structurally complete
+    TrueType file; a truncated earlier download is rejected.
+    """
+
+    metadata = load_font_metadata(font_path)
+    try:
+        data = font_path.read_bytes()
+    except OSError:
+        return False
+    actual = hashlib.sha256(data).hexdigest()
+    expected = metadata.get("sha256")
+    if not isinstance(expected, str):
+        if not looks_like_truetype(data):
+            return False
+        metadata["sha256"] = actual
+        save_font_metadata(font_path, metadata)
+        return True
+    return actual == expected
+
+
+def download_font(target_path: Path, revalidate: bool = True) -> Path:
+    """Fetch the font, revalidating an existing copy with ETag/Last-Modified.
+
+    With ``revalidate=False`` the font is downloaded unconditionally, for an
+    existing copy that must be replaced rather than confirmed.
+    """
 
-def download_font(target_path: Path) -> Path:
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    with urllib.request.urlopen(FONT_DOWNLOAD_URL) as response:
-        target_path.write_bytes(response.read())
+    metadata = load_font_metadata(target_path) if revalidate and target_path.exists() else {}
+
+    request = urllib.request.Request(FONT_DOWNLOAD_URL)
+    if metadata.get("etag"):
+        request.add_header("If-None-Match", metadata["etag"])
+    if metadata.get("last_modified"):
+        request.add_header("If-Modified-Since", metadata["last_modified"])
+
+    # Stream into a sibling file and swap it in only once complete, so an
+    # interrupted transfer never replaces a good cached copy with a partial one.
+    partial_path = target_path.with_name(target_path.name + ".part")
+    try:
+        with urllib.request.urlopen(request) as response, partial_path.open("wb") as fp:
+            sha256 = stream_to_file(response, fp)
+            headers = response.headers
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or not target_path.exists():
+            raise
+        metadata["checked_at"] = time.time()
+        save_font_metadata(target_path, metadata)
+        return target_path
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    if not looks_like_truetype(partial_path.read_bytes()):
+        partial_path.unlink(missing_ok=True)
+        raise ValueError(f"{FONT_DOWNLOAD_URL} did not return a complete TrueType font")
+    os.replace(partial_path, target_path)
+
+    save_font_metadata(
+        target_path,
+        {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "checked_at": time.time(),
+            "sha256": sha256,
+        },
+    )
     return target_path
 
 
+def find_pyinstaller_script() -> str | None:
+    """Return the pyinstaller entry point installed for this interpreter.
+
+    Running it directly skips loading PyInstaller into this process just to
+    fork. Only the scripts directory of the running interpreter is searched:
+    a pyinstaller from another environment (e.g. pipx) would bundle that
+    environment's packages instead of openpyxl and fpdf2.
+    """
+
+    scripts_dir = sysconfig.get_path("scripts")
+    if not scripts_dir:
+        return None
+    return shutil.which("pyinstaller", path=scripts_dir)
+
+
+def pyinstaller_supports_optimize() -> bool:
+    try:
+        version = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    parts = []
+    for piece in version.split(".")[:2]:
+        digits = "".join(ch for ch in piece if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts) >= OPTIMIZE_FLAG_MIN_VERSION
+
+
+def pyinstaller_command() -> list[str]:
+    """Return the PyInstaller invocation with bytecode optimization level 2.
+
+    Stripping asserts and docstrings makes the bundled archive smaller and
+    faster to load. Older PyInstaller releases have no --optimize option, so
+    the interpreter running them is started with -OO instead.
+    """
+
+    if pyinstaller_supports_optimize():
+        script = find_pyinstaller_script()
+        if script is not None:
+            return [script, "--optimize", "2"]
+        return [sys.executable, "-m", "PyInstaller", "--optimize", "2"]
+    return [sys.executable, "-OO", "-m", "PyInstaller"]
+
+
+def find_existing(candidates: list[Path]) -> Path | None:
+    """Return the first existing candidate, listing each directory at most once.
+
+    Directories holding a single candidate are probed with one stat call, as
+    listing e.g. C:/Windows/Fonts just to look up one name costs more than it
+    saves.
+    """
+
+    by_parent: dict[Path, list[Path]] = {}
+    for candidate in candidates:
+        by_parent.setdefault(candidate.parent, []).append(candidate)
+
+    for parent, paths in by_parent.items():
+        if len(paths) == 1:
+            if paths[0].exists():
+                return paths[0]
+            continue
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        for path in paths:
+            if path.name in names:
+                return path
+    return None
+
+
+def query_fontconfig() -> Path | None:
+    """Ask fontconfig where DejaVu Sans is installed (Linux and similar)."""
+
+    try:
+        result = subprocess.run(
+            ["fc-match", "-f", "%{file}\n", "DejaVuSans"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+
+    font_path = Path(result.stdout.strip())
+    # fc-match falls back to the closest font it has, so anything other than
+    # the regular DejaVu Sans face is not what we asked for.
+    if result.returncode == 0 and font_path.name == "DejaVuSans.ttf" and font_path.is_file():
+        return font_path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
 def locate_font() -> Path:
     script_dir = Path(__file__).resolve().parent
     candidates = [
@@ -39,13 +335,34 @@ def locate_font() -> Path:
         Path.home() / "Library/Fonts/DejaVuSans.ttf",
     ]
 
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+    found = find_existing(candidates)
+    if found is not None:
+        return found
+
+    system_font = query_fontconfig()
+    if system_font is not None:
+        return system_font
 
     cache_font = Path.home() / ".cache" / "curators-report" / "DejaVuSans.ttf"
+    if cache_font.exists() and not font_cache_is_intact(cache_font):
+        # A damaged copy must not be revalidated with a conditional request:
+        # the server would answer 304 and the broken file would be kept. It is
+        # only replaced once a complete new copy has been downloaded.
+        try:
+            return download_font(cache_font, revalidate=False)
+        except Exception as exc:  # pragma: no cover - relies on network availability
+            raise FileNotFoundError(
+                f"Кэшированный шрифт {cache_font} повреждён, а скачать новый не удалось. "
+                "Скачайте DejaVuSans.ttf вручную и повторите сборку."
+            ) from exc
     if cache_font.exists():
-        return cache_font
+        if font_cache_is_fresh(cache_font):
+            return cache_font
+        try:
+            return download_font(cache_font)
+        except Exception:  # pragma: no cover - relies on network availability
+            # A stale copy is still a perfectly usable font when offline.
+            return cache_font
 
     try:
         return download_font(cache_font)
@@ -55,13 +372,15 @@ def locate_font() -> Path:
         ) from exc
 
 
-def build_executable() -> None:
-    """Create a standalone .exe for combine_json_to_excel.py."""
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes"}
 
-    ensure_pyinstaller()
 
-    script_path = Path(__file__).with_name("combine_json_to_excel.py")
-    icon_path = script_path.with_name("combine_json_to_excel.ico")
+def build_onefile_requested() -> bool:
+    return env_flag(ONEFILE_ENV_VAR)
+
+
+def prepare_runtime_tmpdir(script_dir: Path) -> Path:
     # Prefer a per-user temp directory for PyInstaller's runtime extraction so
     # the executable can run from read-only locations (e.g. Downloads or
     # network shares) without failing with "Failed to start embedded python
@@ -71,46 +390,162 @@ def build_executable() -> None:
     try:
         runtime_tmpdir.mkdir(parents=True, exist_ok=True)
     except OSError:
-        runtime_tmpdir = script_path.parent / "_pyi_runtime"
+        runtime_tmpdir = script_dir / "_pyi_runtime"
         runtime_tmpdir.mkdir(parents=True, exist_ok=True)
-    if not icon_path.exists():
-        icon_bytes = base64.b64decode("".join(ICON_BASE64))
-        icon_path.write_bytes(icon_bytes)
+    return runtime_tmpdir
+
+
+def choose_workpath() -> Path:
+    """Pick a scratch directory for PyInstaller's intermediate build files.
+
+    The analysis cache and collected libraries are rewritten on every build,
+    so keep them on tmpfs where there is one (/dev/shm on Linux) and in the
+    system temp folder otherwise. The name is stable for one checkout and
+    user, so rebuilds can reuse PyInstaller's cached analysis, while builds of
+    other checkouts or by other users on the same host (e.g. a CI matrix)
+    never share, or fail on, each other's directory.
+    """
+
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK):
+        base = shm
+    else:
+        base = Path(tempfile.gettempdir())
+    checkout = hashlib.sha256(os.fsencode(Path(__file__).resolve().parent)).hexdigest()[:12]
+    # The Windows temp folder is already per user; /dev/shm and /tmp are not.
+    user = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return base / f"curators-report-build-{checkout}{user}"
+
+
+def bundled_package_versions(requirements_path: Path) -> dict[str, str | None]:
+    """Return the installed versions of PyInstaller and every required package."""
+
+    names = ["pyinstaller"]
+    try:
+        lines = requirements_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        name = line.split("#", 1)[0].split(";", 1)[0].strip()
+        for separator in "<>=!~[ ":
+            name = name.split(separator, 1)[0]
+        if name:
+            names.append(name)
+
+    versions: dict[str, str | None] = {}
+    for name in names:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def fingerprint_inputs(command: list[str], inputs: list[Path], packages: dict[str, str | None]) -> str:
+    """Hash the PyInstaller command, the toolchain and the mtimes of everything it bundles.
+
+    The Python and package versions are included because upgrading any of them
+    changes what ends up in the bundle without touching the bundled files.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([command, sys.version, packages], sort_keys=True).encode("utf-8"))
+    for path in inputs:
+        digest.update(f"{path}\0{path.stat().st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def bundle_is_current(artifact: Path, inputs_file: Path, fingerprint: str, inputs: list[Path]) -> bool:
+    try:
+        recorded = json.loads(inputs_file.read_text(encoding="utf-8")).get("fingerprint")
+        artifact_mtime = artifact.stat().st_mtime_ns
+    except (OSError, ValueError, AttributeError):
+        return False
+    return recorded == fingerprint and all(artifact_mtime > path.stat().st_mtime_ns for path in inputs)
+
+
+def build_executable() -> None:
+    """Create a standalone bundle for combine_json_to_excel.py.
+
+    The default is a one-folder bundle: a one-file .exe unpacks the whole
+    archive into a temp directory on every launch, which noticeably slows
+    down startup.
+    """
+
+    script_path = Path(__file__).with_name("combine_json_to_excel.py")
+    icon_path = script_path.with_name("combine_json_to_excel.ico")
     if not script_path.exists():
         raise FileNotFoundError(f"Не найден файл {script_path}")
     if not icon_path.exists():
         raise FileNotFoundError(f"Не найден файл {icon_path}")
 
-    font_path = locate_font()
+    # Installing PyInstaller and finding the font do not depend on each other
+    # and are mostly waiting on pip or the network.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pyinstaller_job = executor.submit(ensure_pyinstaller)
+        font_job = executor.submit(locate_font)
+        pyinstaller_job.result()
+        font_path = font_job.result()
 
-    # Using an explicit runtime extraction directory prevents failures when the
-    # default temp folder is unavailable (e.g. redirected to a network share or
-    # containing non-ASCII characters). This avoids the
-    # "Failed to start embedded python interpreter!" error on some systems.
-    data_sep = os.pathsep
+    onefile = build_onefile_requested()
+    dist_path = Path.cwd() / "dist"
+    script_arg = os.fspath(script_path)
+    icon_arg = os.fspath(icon_path)
 
     command = [
-        sys.executable,
-        "-m",
-        "PyInstaller",
-        "--noconfirm",
-        "--onefile",
-        "--windowed",
-        "--name",
-        "Combine Json to Excel",
+        *pyinstaller_command(),
+        *BASE_PYINSTALLER_ARGS,
+        ONEFILE_ARG if onefile else ONEDIR_ARG,
         "--icon",
-        str(icon_path),
-        "--runtime-tmpdir",
-        str(runtime_tmpdir),
+        icon_arg,
         "--add-data",
-        f"{icon_path}{data_sep}.",
+        icon_arg + DATA_TARGET,
         "--add-data",
-        f"{font_path}{data_sep}.",
-        str(script_path),
+        os.fspath(font_path) + DATA_TARGET,
+        "--workpath",
+        os.fspath(choose_workpath()),
+        "--distpath",
+        os.fspath(dist_path),
     ]
+    if not env_flag(UPX_ENV_VAR):
+        # UPX makes the bundle ~30% smaller, but every compressed DLL is then
+        # unpacked in memory on each launch, which slows down startup.
+        command.append("--noupx")
+    if onefile:
+        # Using an explicit runtime extraction directory prevents failures when the
+        # default temp folder is unavailable (e.g. redirected to a network share or
+        # containing non-ASCII characters). This avoids the
+        # "Failed to start embedded python interpreter!" error on some systems.
+        runtime_tmpdir = prepare_runtime_tmpdir(script_path.parent)
+        command += ["--runtime-tmpdir", os.fspath(runtime_tmpdir)]
+    command.append(script_arg)
+
+    # Skip PyInstaller entirely when neither the command, the toolchain nor any
+    # bundled input changed since the last successful build.
+    inputs = [script_path, icon_path, font_path]
+    packages = bundled_package_versions(script_path.with_name("requirements.txt"))
+    fingerprint = fingerprint_inputs(command, inputs, packages)
+    inputs_file = dist_path / ".build-inputs.json"
+    if onefile:
+        artifact = dist_path / (APP_NAME + (".exe" if sys.platform == "win32" else ""))
+    else:
+        artifact = dist_path / APP_NAME
+    if not env_flag(FORCE_ENV_VAR) and bundle_is_current(artifact, inputs_file, fingerprint, inputs):
+        print(f"Сборка актуальна, пропускаем: {artifact}")
+        return
 
-    subprocess.check_call(command)
-    print("Готово! Проверьте папку dist/ для исполняемого файла.")
+    with tempfile.TemporaryDirectory(prefix="curators-report-pyi-") as config_dir:
+        env = os.environ.copy()
+        # A private config/cache directory keeps parallel builds (e.g. a CI
+        # matrix running this script several times) from corrupting each
+        # other's PyInstaller cache. An explicitly configured one is kept.
+        env.setdefault("PYINSTALLER_CONFIG_DIR", config_dir)
+        subprocess.run(command, check=True, env=env)
+    inputs_file.write_text(json.dumps({"fingerprint": fingerprint}), encoding="utf-8")
+    if onefile:
+        print(f"Готово! Исполняемый файл: dist/{APP_NAME}.exe")
+    else:
+        print(f"Готово! Запускайте dist/{APP_NAME}/{APP_NAME}.exe")
 
 
 if __name__ == "__main__":
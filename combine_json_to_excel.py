@@ -16,49 +16,51 @@ highlighted to distinguish the block of rows taken by that subtable.
 from __future__ import annotations
 
 import argparse
-import importlib.util
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import importlib
 from dataclasses import dataclass
-import base64
 import json
+import math
+import mmap
+import multiprocessing
+import os
 import re
 import urllib.request
+import zipfile
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import sys
-from typing import Dict, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Tuple
 
-from icon_data import ICON_BASE64
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
 
-REQUIRED_PACKAGES = [("openpyxl", "openpyxl"), ("fpdf2", "fpdf")]
 FONT_DOWNLOAD_URL = "https://github.com/dejavu-fonts/dejavu-fonts/raw/master/ttf/DejaVuSans.ttf"
 
 
-def ensure_dependencies_installed() -> None:
-    """Install required third-party packages at runtime when missing."""
+def require_package(package: str, module_name: str) -> None:
+    """Fail with a readable message when a third-party package is missing.
 
-    # When running from a bundled executable (PyInstaller), dependencies are
-    # already packaged. Spawning pip from within the executable would relaunch
-    # the same binary repeatedly, quickly exhausting system resources.
-    if getattr(sys, "frozen", False):
-        return
+    Checked where the package is first needed rather than on import, since
+    the default XML engine and the GUI start without any of them.
+    """
 
-    missing = [pkg for pkg, module_name in REQUIRED_PACKAGES if importlib.util.find_spec(module_name) is None]
-    if missing:
+    try:
+        importlib.import_module(module_name)
+    except ImportError as exc:
         raise RuntimeError(
-            "Не найдены обязательные зависимости: "
-            f"{', '.join(missing)}. Установите их с помощью `pip install -r requirements.txt` "
-            "или вручную добавьте пакеты перед запуском программы."
-        )
-
+            f"Не найдена зависимость: {package}. Установите её с помощью `pip install -r requirements.txt` "
+            "или вручную добавьте пакет перед запуском программы."
+        ) from exc
 
-ensure_dependencies_installed()
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from fpdf import FPDF
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is the fallback
+    orjson = None
 
 
 def get_resource_path(relative_path: str) -> Path:
@@ -68,26 +70,6 @@ def get_resource_path(relative_path: str) -> Path:
     return base_path / relative_path
 
 
-def ensure_icon_path() -> Path:
-    """Make sure the ICO file exists locally when not running from a bundle."""
-
-    icon_path = get_resource_path("combine_json_to_excel.ico")
-    if icon_path.exists():
-        return icon_path
-
-    if hasattr(sys, "_MEIPASS"):
-        # In a bundled executable the icon should already be present alongside the binary.
-        return icon_path
-
-    try:
-        icon_bytes = base64.b64decode("".join(ICON_BASE64))
-        icon_path.write_bytes(icon_bytes)
-    except OSError:
-        # If the path is not writable, silently continue without the icon.
-        pass
-    return icon_path
-
-
 def ensure_font_path() -> Path:
     """Locate a Unicode-capable font, downloading it if necessary."""
 
@@ -129,24 +111,39 @@ JsonValue = ScalarValue | ListValue
 JsonRecord = Dict[str, JsonValue]
 
 
-HIGHLIGHT_FILL = PatternFill(start_color="FFF8DC", end_color="FFF8DC", fill_type="solid")
+HIGHLIGHT_COLOR = "FFF8DC"
+# zipfile hands the deflated sheet XML over in small pieces; a large buffer
+# turns those into a few big writes to the output file.
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Column width used when auto width is off. The writers add their usual two
+# characters of padding, so such columns come out 22 characters wide.
+FIXED_COLUMN_WIDTH = 20
+# Deflate level for the workbook zip. Level 1 compresses faster than zlib's
+# default 6, in exchange for a somewhat bigger file.
+FAST_COMPRESS_LEVEL = 1
 
 
 def format_scalar_list(items: ListValue) -> str:
     """Sort list items and join them with a comma for display."""
 
-    sorted_items = sorted((str(item) for item in items), key=str)
-    return ", ".join(sorted_items)
+    if len(items) < 2:
+        return str(items[0]) if items else ""
+    return ", ".join(sorted(map(str, items)))
 
 
 def normalize_cell_value(value: JsonValue) -> ScalarValue:
     """Convert any JSON value into something openpyxl can store."""
 
+    # Answers are overwhelmingly text, and an exact type check is the cheapest test
+    if type(value) is str:
+        return value
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, list) and all(not isinstance(item, (dict, list)) for item in value):
         return format_scalar_list(value)
-    # Fallback for types like dicts or lists of non-scalar values
+    # Fallback for types like dicts or lists of non-scalar values. Stdlib json
+    # is used even when orjson is installed: these cells are rare, and orjson's
+    # compact separators would make the same answer read differently.
     return json.dumps(value, ensure_ascii=False)
 
 
@@ -171,22 +168,94 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Generate per-respondent PDF с подробной разбивкой баллов.",
     )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(WORKBOOK_ENGINES),
+        default=DEFAULT_WORKBOOK_ENGINE,
+        help=f"Library used to write the workbook (default: {DEFAULT_WORKBOOK_ENGINE}).",
+    )
+    parser.add_argument(
+        "--auto-width",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Size columns to their longest line (default). --no-auto-width skips that pass "
+            f"and gives every column a width of {FIXED_COLUMN_WIDTH + 2}."
+        ),
+    )
+    parser.add_argument(
+        "--fast-compress",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            f"Zip the workbook at deflate level {FAST_COMPRESS_LEVEL} (default). --no-fast-compress uses "
+            "zlib's default level for a smaller file. Applies to the xml and openpyxl engines."
+        ),
+    )
     return parser.parse_args()
 
 
-def load_json_files(input_dir: Path) -> List[Tuple[Path, JsonRecord]]:
-    json_files = sorted(input_dir.glob("*.json"))
+def parse_json_bytes(raw: bytes) -> object:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def list_json_files(input_dir: Path) -> List[Path]:
+    # A single scandir pass with a suffix check is cheaper than Path.glob's
+    # pattern matching; normcase keeps the match case-insensitive on Windows.
+    # Sorting the plain strings (normcased, as Path ordering is) and building
+    # the Path objects afterwards avoids the much slower Path comparisons.
+    with os.scandir(input_dir) as entries:
+        names = sorted(
+            (entry.path for entry in entries if os.path.normcase(entry.name).endswith(".json") and entry.is_file()),
+            key=os.path.normcase,
+        )
+    return [Path(name) for name in names]
+
+
+# orjson can parse straight from a memory map, so files at least this large
+# are not copied into a bytes object first.
+MMAP_MIN_SIZE = 1 << 20
+
+
+def load_json_file(path: Path) -> Tuple[Path, JsonRecord]:
+    with path.open("rb") as file:
+        if orjson is not None and os.fstat(file.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                data = orjson.loads(view)
+        else:
+            data = parse_json_bytes(file.read())
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON file {path} does not contain an object at the top level.")
+    return path, data
+
+
+def iter_json_files(input_dir: Path) -> Iterator[Tuple[Path, JsonRecord]]:
+    """Yield ``(path, record)`` pairs in file name order as the files are parsed."""
+
+    json_files = list_json_files(input_dir)
     if not json_files:
         raise FileNotFoundError(f"No JSON files found in {input_dir}")
 
-    records: List[Tuple[Path, JsonRecord]] = []
-    for path in json_files:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            raise ValueError(f"JSON file {path} does not contain an object at the top level.")
-        records.append((path, data))
-    return records
+    # File reads release the GIL, so a few threads overlap the per-file I/O
+    # with parsing. Only a small window of files is read ahead, so a consumer
+    # that handles one record at a time never holds the whole directory.
+    workers = min(8, len(json_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future[Tuple[Path, JsonRecord]]] = deque()
+        for path in json_files:
+            pending.append(executor.submit(load_json_file, path))
+            if len(pending) > 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def load_json_files(input_dir: Path) -> List[Tuple[Path, JsonRecord]]:
+    return list(iter_json_files(input_dir))
 
 
 QUESTION_ORDER: List[Dict[str, object]] = [
@@ -322,28 +391,27 @@ QUESTION_ORDER: List[Dict[str, object]] = [
 class QuestionColumn:
     key: str
     label: str
-    subfields: List[Tuple[str, str]] | None = None
-
+    subfields: Tuple[Tuple[str, str], ...] | None = None
 
-def determine_columns(records: Iterable[Tuple[Path, JsonRecord]]) -> List[QuestionColumn]:
-    present_keys = {key for _, record in records for key in record.keys()}
-    columns: List[QuestionColumn] = []
 
-    for question in QUESTION_ORDER:
-        key = question["key"]  # type: ignore[index]
-        always_include = bool(question.get("always"))
-        if not always_include and key not in present_keys:
-            continue
+# QUESTION_ORDER never changes at runtime, so turn it into columns once.
+QUESTION_COLUMNS: List[QuestionColumn] = [
+    QuestionColumn(
+        key=question["key"],  # type: ignore[arg-type]
+        label=question["label"],  # type: ignore[arg-type]
+        subfields=tuple(question["subfields"].items()) if question.get("subfields") else None,  # type: ignore[attr-defined]
+    )
+    for question in QUESTION_ORDER
+]
+ALWAYS_INCLUDED_KEYS = frozenset(question["key"] for question in QUESTION_ORDER if question.get("always"))
 
-        label = question["label"]  # type: ignore[index]
-        subfields: Dict[str, str] | None = question.get("subfields")  # type: ignore[assignment]
 
-        if subfields:
-            columns.append(QuestionColumn(key=key, label=label, subfields=list(subfields.items())))
-        else:
-            columns.append(QuestionColumn(key=key, label=label))
+def determine_columns(records: Iterable[Tuple[Path, JsonRecord]]) -> List[QuestionColumn]:
+    present_keys = set(ALWAYS_INCLUDED_KEYS)
+    for _, record in records:
+        present_keys.update(record)
 
-    return columns
+    return [column for column in QUESTION_COLUMNS if column.key in present_keys]
 
 
 def normalize_reporting_period(value: JsonValue) -> Dict[str, ScalarValue]:
@@ -367,30 +435,44 @@ def normalize_reporting_period(value: JsonValue) -> Dict[str, ScalarValue]:
     return {"date_start": date_start, "date_end": date_end}
 
 
-def normalize_record_values(record: JsonRecord) -> JsonRecord:
-    """Merge scalar lists into comma-separated strings for single-cell output."""
+def normalize_record_values(record: JsonRecord) -> Tuple[JsonRecord, int]:
+    """Merge scalar lists into comma-separated strings for single-cell output.
 
-    normalized: JsonRecord = {}
+    Also returns how many sheet rows the record takes: the length of its
+    longest remaining list, and at least one.
+    """
+
+    # Most answers are kept as they are, so copy the record in one go and only
+    # replace the values that change; the caller adds its own keys to it.
+    normalized: JsonRecord = dict(record)
+    block_height = 1
     for key, value in record.items():
-        if key == "reporting_period":
-            normalized[key] = normalize_reporting_period(value)
-            continue
+        if isinstance(value, list):
+            if all(not isinstance(item, (dict, list)) for item in value):
+                normalized[key] = format_scalar_list(value)
+            elif key != "reporting_period" and len(value) > block_height:
+                block_height = len(value)
 
-        if isinstance(value, list) and all(not isinstance(item, (dict, list)) for item in value):
-            normalized[key] = format_scalar_list(value)
-        else:
-            normalized[key] = value
+    if "reporting_period" in record:
+        normalized["reporting_period"] = normalize_reporting_period(record["reporting_period"])
+
+    return normalized, block_height
 
-    return normalized
+
+# Must accept exactly what isAffirmative() in index.html accepts, otherwise
+# the workbook and the form would show different scores.
+YES_ANSWERS = frozenset({"да"})
 
 
 def is_yes(value: JsonValue) -> bool:
     """Return True when the answer represents an affirmative response."""
 
-    if isinstance(value, bool):
+    # The form exports yes/no questions as JSON booleans, so test those by
+    # identity before falling back to the string spelling.
+    if value is True or value is False:
         return value
     if isinstance(value, str):
-        return value.strip().lower() == "да"
+        return value.strip().lower() in YES_ANSWERS
     return False
 
 
@@ -412,37 +494,41 @@ def count_filled_rows(value: JsonValue) -> int:
     return sum(1 for item in value if row_has_content(item))
 
 
-def count_rows_with_specialists(value: JsonValue) -> int:
-    """Count curator hour rows that include invited specialists."""
+def count_filled_rows_and_specialists(value: JsonValue) -> Tuple[int, int]:
+    """Count filled curator hour rows and those with invited specialists in one pass."""
 
     if not isinstance(value, list):
-        return 0
+        return 0, 0
 
-    count = 0
+    filled = with_specialists = 0
     for item in value:
+        if not row_has_content(item):
+            continue
+        filled += 1
         if not isinstance(item, dict):
             continue
         specialists = item.get("specialists")
         if isinstance(specialists, str) and specialists.strip():
-            count += 1
+            with_specialists += 1
         elif isinstance(specialists, list) and any(specialist for specialist in specialists):
-            count += 1
-    return count
+            with_specialists += 1
+    return filled, with_specialists
 
 
 def compute_point_components(record: JsonRecord) -> List[Tuple[str, int]]:
     """Return detailed point components for a survey record."""
 
-    value_11 = record.get("held_minimum_three_curator_sessions_in_reporting_period")
-    value_12 = record.get("curator_hours_details")
-    value_13 = record.get("manages_group_chat")
-    value_14 = record.get("inform_group_about_events")
-    value_16 = record.get("participated_in_two_events_with_group")
-    value_17 = record.get("joint_participation_events")
-    value_18 = record.get("participated_in_two_curator_events")
-    value_19 = record.get("curator_personal_events")
-
-    count_12 = count_filled_rows(value_12)
+    get = record.get
+    value_11 = get("held_minimum_three_curator_sessions_in_reporting_period")
+    value_12 = get("curator_hours_details")
+    value_13 = get("manages_group_chat")
+    value_14 = get("inform_group_about_events")
+    value_16 = get("participated_in_two_events_with_group")
+    value_17 = get("joint_participation_events")
+    value_18 = get("participated_in_two_curator_events")
+    value_19 = get("curator_personal_events")
+
+    count_12, specialists_12 = count_filled_rows_and_specialists(value_12)
     count_17 = count_filled_rows(value_17)
     count_19 = count_filled_rows(value_19)
 
@@ -469,44 +555,44 @@ def compute_point_components(record: JsonRecord) -> List[Tuple[str, int]]:
     components.append(
         (
             "Личное участие в программах и конкурсах (п.20)",
-            count_filled_rows(record.get("personal_program_participation")) * 10,
+            count_filled_rows(get("personal_program_participation")) * 10,
         )
     )
     components.append(
         (
             "Опубликование научной работы (п.22)",
-            count_filled_rows(record.get("scientific_publications")) * 20,
+            count_filled_rows(get("scientific_publications")) * 20,
         )
     )
     components.append(
         (
             "Интервью и статьи для \"Дзен.Гуап\" и соцсетей (п.23)",
-            count_filled_rows(record.get("media_materials")) * 10,
+            count_filled_rows(get("media_materials")) * 10,
         )
     )
     components.append(
         (
             "Наставничество в проектах (п.21)",
-            count_filled_rows(record.get("mentor_support_events")) * 10,
+            count_filled_rows(get("mentor_support_events")) * 10,
         )
     )
     components.append(
         (
             "Призовые места обучающихся (п.15)",
-            count_filled_rows(record.get("achievements")) * 10,
+            count_filled_rows(get("achievements")) * 10,
         )
     )
     components.append(
         (
             "Курсы повышения квалификации (п.24)",
-            count_filled_rows(record.get("qualification_courses")) * 20,
+            count_filled_rows(get("qualification_courses")) * 20,
         )
     )
 
     components.append(
         (
             "Приглашённые специалисты на кураторских часах (п.12)",
-            count_rows_with_specialists(value_12) * 20,
+            specialists_12 * 20,
         )
     )
 
@@ -548,8 +634,11 @@ def stringify_value(value: JsonValue) -> str:
     return str(value)
 
 
+UNSAFE_FILENAME_CHARS = re.compile(r"[\\/:*?\"<>|]")
+
+
 def sanitize_filename(value: str) -> str:
-    safe_value = re.sub(r"[\\/:*?\"<>|]", "_", value).strip()
+    safe_value = UNSAFE_FILENAME_CHARS.sub("_", value).strip()
     return safe_value or "Без_ФИО"
 
 
@@ -581,21 +670,30 @@ def generate_score_pdf(
     components: List[Tuple[str, int]],
     output_path: Path,
     total: int,
+    font_path: Path | None = None,
 ) -> None:
+    # Imported here like openpyxl: fpdf2 is slow to import and only the PDF
+    # reports need it.
+    require_package("fpdf2", "fpdf")
+    from fpdf import FPDF, XPos, YPos
+
     pdf = FPDF()
     pdf.add_page()
 
-    font_path = ensure_font_path()
-    pdf.add_font("DejaVu", "", str(font_path), uni=True)
-    pdf.add_font("DejaVu", "B", str(font_path), uni=True)
+    if font_path is None:
+        font_path = ensure_font_path()
+    # Parsing the TTF is most of the cost of a report and fpdf2 keeps the
+    # parsed font per document, so register the file only once. The "bold"
+    # style used to be the very same regular face loaded a second time.
+    pdf.add_font("DejaVu", "", str(font_path))
     body_font = ("DejaVu", "")
-    heading_font = ("DejaVu", "B")
+    heading_font = body_font
 
     pdf.set_font(*heading_font, size=14)
-    pdf.cell(0, 10, "Отчёт по баллам", ln=True)
+    pdf.cell(0, 10, "Отчёт по баллам", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
     pdf.set_font(*body_font, size=12)
-    pdf.cell(0, 10, f"ФИО: {full_name}", ln=True)
+    pdf.cell(0, 10, f"ФИО: {full_name}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     pdf.ln(2)
 
     table_width = pdf.w - pdf.l_margin - pdf.r_margin
@@ -604,7 +702,7 @@ def generate_score_pdf(
 
     pdf.set_font(*heading_font, size=11)
     pdf.cell(column_width, 8, "Критерий", border=1)
-    pdf.cell(points_width, 8, "Баллы", border=1, ln=True, align="R")
+    pdf.cell(points_width, 8, "Баллы", border=1, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="R")
 
     pdf.set_font(*body_font, size=11)
     for description, points in components:
@@ -612,121 +710,180 @@ def generate_score_pdf(
 
     pdf.set_font(*heading_font, size=12)
     pdf.cell(column_width, 10, "Итого", border=1)
-    pdf.cell(points_width, 10, str(total), border=1, ln=True, align="R")
+    pdf.cell(points_width, 10, str(total), border=1, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="R")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     pdf.output(str(output_path))
 
 
+ScoreReportJob = Tuple[Path, str, JsonRecord, Path]
+
+
+def render_score_report(job: ScoreReportJob) -> None:
+    """Build one score PDF; a module-level function so worker processes can run it."""
+
+    pdf_path, full_name, raw_record, font_path = job
+    components = compute_point_components(raw_record)
+    total_points = sum(points for _, points in components)
+    generate_score_pdf(
+        full_name=full_name,
+        components=components,
+        output_path=pdf_path,
+        total=total_points,
+        font_path=font_path,
+    )
+
+
 def generate_score_reports(records: List[Tuple[Path, JsonRecord]], target_dir: Path) -> None:
+    # Report a missing fpdf2 here, before any worker process is started.
+    require_package("fpdf2", "fpdf")
+    # Resolve (and possibly download) the font once instead of in every worker.
+    font_path = ensure_font_path()
+
+    # Respondents with the same name map to the same file; keep the last one,
+    # as sequential generation would, so two workers never write one path.
+    jobs: Dict[Path, ScoreReportJob] = {}
     for file_path, raw_record in records:
-        components = compute_point_components(raw_record)
-        total_points = sum(points for _, points in components)
         full_name = extract_full_name(raw_record, fallback=file_path.stem)
         safe_name = sanitize_filename(full_name)
         pdf_name = f"Баллы_{safe_name}.pdf"
         pdf_path = target_dir / pdf_name
-        generate_score_pdf(full_name=full_name, components=components, output_path=pdf_path, total=total_points)
+        jobs.pop(pdf_path, None)
+        jobs[pdf_path] = (pdf_path, full_name, raw_record, font_path)
+
+    if len(jobs) < 2:
+        for job in jobs.values():
+            render_score_report(job)
+        return
 
+    # PDF layout is pure-Python CPU work, so spread it over processes.
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs))) as executor:
+        list(executor.map(render_score_report, jobs.values()))
 
-def write_workbook(
+
+@dataclass
+class SheetData:
+    """The merged table with its styling, independent of the Excel library.
+
+    Row and column numbers are 1-based like in Excel; ``rows`` starts with the
+    two header rows, ``widths`` holds the longest line per column.
+    """
+
+    rows: List[List[ScalarValue]]
+    merged_ranges: List[Tuple[int, int, int, int]]
+    highlight_blocks: List[Tuple[int, int, int, int]]
+    score_column: int | None
+    widths: List[int]
+
+
+def column_cells(value: JsonValue, subkey: str | None, block_height: int) -> List[ScalarValue]:
+    """Return one column of a respondent's block, ``block_height`` cells long.
+
+    The value's shape is checked once per record and column rather than once
+    per cell; lists spread over the block, anything else fills the first row.
+    """
+
+    if isinstance(value, list):
+        if subkey is None:
+            cells = [normalize_cell_value(item) for item in value]
+        else:
+            cells = [
+                normalize_cell_value(item.get(subkey)) if isinstance(item, dict) else None
+                for item in value
+            ]
+        cells.extend([None] * (block_height - len(cells)))
+        return cells
+
+    if isinstance(value, dict):
+        first = normalize_cell_value(value.get(subkey) if subkey is not None else value)
+    elif subkey is None:
+        first = normalize_cell_value(value)
+    else:
+        first = None
+    return [first] + [None] * (block_height - 1)
+
+
+def widen_columns(widths: List[int], row_values: List[ScalarValue]) -> None:
+    """Grow ``widths`` to the longest line of each non-empty cell in the row."""
+
+    for col, value in enumerate(row_values):
+        if value is None:
+            continue
+        text = value if type(value) is str else str(value)
+        # Most answers are one line; the membership test is a C-level scan,
+        # so only multi-line text pays for split().
+        width = max(map(len, text.split("\n"))) if "\n" in text else len(text)
+        if width > widths[col]:
+            widths[col] = width
+
+
+def build_sheet(
     records: List[Tuple[Path, JsonRecord]],
     questions: List[QuestionColumn],
-    output_path: Path,
-) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Responses"
-
-    ws.cell(row=1, column=1, value="Источник")
-    ws.merge_cells(start_row=1, start_column=1, end_row=2, end_column=1)
+    auto_width: bool = True,
+) -> SheetData:
+    header_top: List[ScalarValue] = ["Источник"]
+    header_sub: List[ScalarValue] = [None]
+    # (first_row, first_col, last_row, last_col)
+    merged_ranges = [(1, 1, 2, 1)]
 
     flat_columns: List[Tuple[str, str | None]] = []
+    # (key, first_col, last_col) of every question, for the highlight blocks
+    question_spans: List[Tuple[str, int, int]] = []
     column_index = 2
     for question in questions:
         span = len(question.subfields) if question.subfields else 1
+        question_spans.append((question.key, column_index, column_index + span - 1))
 
+        header_top.append(question.label)
         if question.subfields:
-            ws.merge_cells(
-                start_row=1,
-                start_column=column_index,
-                end_row=1,
-                end_column=column_index + span - 1,
-            )
-            ws.cell(row=1, column=column_index, value=question.label)
-            for offset, (subkey, sublabel) in enumerate(question.subfields):
-                ws.cell(row=2, column=column_index + offset, value=sublabel)
+            header_top.extend([None] * (span - 1))
+            merged_ranges.append((1, column_index, 1, column_index + span - 1))
+            for subkey, sublabel in question.subfields:
+                header_sub.append(sublabel)
                 flat_columns.append((question.key, subkey))
         else:
-            ws.merge_cells(
-                start_row=1,
-                start_column=column_index,
-                end_row=2,
-                end_column=column_index,
-            )
-            ws.cell(row=1, column=column_index, value=question.label)
+            header_sub.append(None)
+            merged_ranges.append((1, column_index, 2, column_index))
             flat_columns.append((question.key, None))
 
         column_index += span
 
-    alignment_top = Alignment(vertical="top")
-    for header_cell in ws[1] + ws[2]:
-        if header_cell.value is not None:
-            header_cell.alignment = alignment_top
+    rows: List[List[ScalarValue]] = [header_top, header_sub]
+    if auto_width:
+        # Widths grow as rows are produced instead of re-reading the whole sheet.
+        widths = [0] * len(header_top)
+        widen_columns(widths, header_top)
+        widen_columns(widths, header_sub)
+    else:
+        widths = [FIXED_COLUMN_WIDTH] * len(header_top)
+    highlight_blocks: List[Tuple[int, int, int, int]] = []
 
     for file_path, raw_record in records:
-        record = normalize_record_values(raw_record)
+        record, block_height = normalize_record_values(raw_record)
         record["score"] = compute_points(raw_record)
-        block_height = max(
-            (
-                len(value) if isinstance(value, list) else 1
-                for value in record.values()
-            ),
-            default=1,
+        start_row = len(rows) + 1
+        # Padding below shorter answers stays None: write-only append() skips
+        # None outright, while "" would be written out as an empty string cell.
+        # Build the block column by column and let zip() turn it into rows.
+        columns = [[file_path.name] + [None] * (block_height - 1)]
+        columns.extend(
+            column_cells(record.get(question_key), subkey, block_height) for question_key, subkey in flat_columns
         )
-        for row_offset in range(block_height):
-            row_values = [file_path.name if row_offset == 0 else ""]
-            for question_key, subkey in flat_columns:
-                value = record.get(question_key)
-                if isinstance(value, list):
-                    if row_offset < len(value):
-                        item = value[row_offset]
-                        if subkey is not None and isinstance(item, dict):
-                            cell_value = normalize_cell_value(item.get(subkey))
-                        elif subkey is None:
-                            cell_value = normalize_cell_value(item)
-                        else:
-                            cell_value = ""
-                    else:
-                        cell_value = ""
-                elif isinstance(value, dict):
-                    if subkey is not None:
-                        cell_value = normalize_cell_value(value.get(subkey)) if row_offset == 0 else ""
-                    elif row_offset == 0:
-                        cell_value = normalize_cell_value(value)
-                    else:
-                        cell_value = ""
-                else:
-                    if subkey is not None:
-                        cell_value = ""
-                    else:
-                        cell_value = normalize_cell_value(value) if row_offset == 0 else ""
-                row_values.append(cell_value)
-            ws.append(row_values)
-
-        # Apply highlighting to list ranges per question
-        start_row = ws.max_row - block_height + 1
-        column_start = 2
-        for question in questions:
-            span = len(question.subfields) if question.subfields else 1
-            value = record.get(question.key)
+        if auto_width:
+            for row_values in map(list, zip(*columns)):
+                widen_columns(widths, row_values)
+                rows.append(row_values)
+        else:
+            rows.extend(map(list, zip(*columns)))
+
+        # Remember list ranges per question so they can be highlighted
+        for question_key, first_col, last_col in question_spans:
+            value = record.get(question_key)
             if isinstance(value, list) and value:
-                for offset in range(span):
-                    for row_index in range(start_row, start_row + len(value)):
-                        ws.cell(row=row_index, column=column_start + offset).fill = HIGHLIGHT_FILL
-            column_start += span
+                highlight_blocks.append((start_row, first_col, start_row + len(value) - 1, last_col))
 
-    score_column_index = next(
+    score_column = next(
         (
             index + 2
             for index, (key, subkey) in enumerate(flat_columns)
@@ -735,36 +892,475 @@ def write_workbook(
         None,
     )
 
-    if score_column_index is not None:
-        score_alignment = Alignment(horizontal="left", vertical="top")
-        for row_index in range(1, ws.max_row + 1):
-            cell = ws.cell(row=row_index, column=score_column_index)
-            if row_index >= 3 and cell.value not in (None, ""):
-                cell.font = Font(bold=True)
-            cell.alignment = score_alignment
+    return SheetData(
+        rows=rows,
+        merged_ranges=merged_ranges,
+        highlight_blocks=highlight_blocks,
+        score_column=score_column,
+        widths=widths,
+    )
 
-    for col_idx, column_cells in enumerate(ws.columns, start=1):
-        max_length = 0
-        for cell in column_cells:
-            if cell.value is None:
-                continue
-            for line in str(cell.value).split("\n"):
-                max_length = max(max_length, len(line))
 
-        if max_length:
-            column_letter = get_column_letter(col_idx)
-            ws.column_dimensions[column_letter].width = max_length + 2
+def write_sheet_openpyxl(sheet: SheetData, output_path: Path, compresslevel: int | None = FAST_COMPRESS_LEVEL) -> None:
+    # Write-only mode streams rows straight into the sheet XML instead of
+    # keeping a Cell object per value. Column widths are written before the
+    # first row and cells cannot be restyled after appending, so cells are
+    # styled while they are emitted.
+    # openpyxl takes a few hundred milliseconds to import, so it is imported
+    # here rather than at module level; the GUI start, --help and the PDF
+    # worker processes do not pay for it.
+    require_package("openpyxl", "openpyxl")
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange
+    from openpyxl.writer.excel import ExcelWriter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Responses")
+
+    for col, width in enumerate(sheet.widths, start=1):
+        if width:
+            ws.column_dimensions[get_column_letter(col)].width = width + 2
+
+    highlighted_rows: Dict[int, set[int]] = {}
+    for first_row, first_col, last_row, last_col in sheet.highlight_blocks:
+        columns = range(first_col - 1, last_col)
+        for row_index in range(first_row, last_row + 1):
+            highlighted_rows.setdefault(row_index, set()).update(columns)
+
+    # Named styles are registered once; assigning one by name copies its
+    # style ids, where setting fill/font/alignment looks each object up again.
+    wb.add_named_style(
+        NamedStyle(
+            name="Highlight",
+            fill=PatternFill(start_color=HIGHLIGHT_COLOR, end_color=HIGHLIGHT_COLOR, fill_type="solid"),
+        )
+    )
+    wb.add_named_style(NamedStyle(name="Header", alignment=Alignment(vertical="top")))
+    wb.add_named_style(NamedStyle(name="Score", alignment=Alignment(horizontal="left", vertical="top")))
+    wb.add_named_style(
+        NamedStyle(
+            name="Score total",
+            font=Font(bold=True),
+            alignment=Alignment(horizontal="left", vertical="top"),
+        )
+    )
+    score_index = sheet.score_column - 1 if sheet.score_column is not None else None
+
+    for row_index, row_values in enumerate(sheet.rows, start=1):
+        row_cells: List[object] = list(row_values)
+        if row_index <= 2:
+            for col, value in enumerate(row_values):
+                if value is not None and col != score_index:
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.style = "Header"
+                    row_cells[col] = cell
+        for col in highlighted_rows.get(row_index, ()):
+            cell = WriteOnlyCell(ws, value=row_values[col])
+            cell.style = "Highlight"
+            row_cells[col] = cell
+        if score_index is not None:
+            value = row_values[score_index]
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = "Score total" if row_index >= 3 and value not in (None, "") else "Score"
+            row_cells[score_index] = cell
+        ws.append(row_cells)
+
+    for first_row, first_col, last_row, last_col in sheet.merged_ranges:
+        ws.merged_cells.add(
+            CellRange(min_row=first_row, min_col=first_col, max_row=last_row, max_col=last_col)
+        )
+
+    # Workbook.save() always zips at the default level, so hand ExcelWriter
+    # an archive opened with the requested one.
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+        archive = zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel)
+        ExcelWriter(wb, archive).save()
+
+
+def write_sheet_pyexcelerate(sheet: SheetData, output_path: Path, compresslevel: int | None = None) -> None:
+    """Bulk-write the sheet with PyExcelerate, which emits XML from templates.
+
+    PyExcelerate zips at its own fixed level, so ``compresslevel`` is ignored.
+    """
+
+    require_package("pyexcelerate", "pyexcelerate")
+    from pyexcelerate import Alignment as XAlignment
+    from pyexcelerate import Color, Fill, Style
+    from pyexcelerate import Font as XFont
+    from pyexcelerate import Workbook as XWorkbook
+
+    wb = XWorkbook()
+    ws = wb.new_sheet("Responses", data=sheet.rows)
+
+    # One shared Style object per look keeps the style table small.
+    # PyExcelerate defaults to horizontal="left"; headers only align to the top.
+    header_style = Style(alignment=XAlignment(horizontal="general", vertical="top"))
+    score_style = Style(alignment=XAlignment(horizontal="left", vertical="top"))
+    score_total_style = Style(
+        font=XFont(bold=True),
+        alignment=XAlignment(horizontal="left", vertical="top"),
+    )
+    highlight_style = Style(fill=Fill(background=Color(255, 248, 220)))
+
+    for col, width in enumerate(sheet.widths, start=1):
+        if width:
+            ws.set_col_style(col, Style(size=width + 2))
+
+    for row_index in (1, 2):
+        for col, value in enumerate(sheet.rows[row_index - 1], start=1):
+            if value is not None and col != sheet.score_column:
+                ws.set_cell_style(row_index, col, header_style)
+
+    for first_row, first_col, last_row, last_col in sheet.highlight_blocks:
+        for row_index in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                ws.set_cell_style(row_index, col, highlight_style)
+
+    if sheet.score_column is not None:
+        for row_index, row_values in enumerate(sheet.rows, start=1):
+            value = row_values[sheet.score_column - 1]
+            if row_index >= 3 and value not in (None, ""):
+                ws.set_cell_style(row_index, sheet.score_column, score_total_style)
+            else:
+                ws.set_cell_style(row_index, sheet.score_column, score_style)
+
+    for first_row, first_col, last_row, last_col in sheet.merged_ranges:
+        ws.range((first_row, first_col), (last_row, last_col)).merge()
+
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+        wb.save(stream)
+
+
+# Looks of individually styled cells; the numbers double as the cellXfs
+# indexes of XLSX_STYLES.
+DEFAULT_STYLE, HEADER_STYLE, HIGHLIGHT_STYLE, SCORE_STYLE, SCORE_TOTAL_STYLE = range(5)
+
+
+def iter_styled_rows(sheet: SheetData) -> Iterator[Tuple[int, List[ScalarValue], Dict[int, int]]]:
+    """Yield ``(row_index, row_values, styles)`` with the style of each styled cell.
+
+    ``styles`` maps 0-based columns to one of the style ids above; cells that
+    are missing from it keep the default look.
+    """
+
+    score_index = sheet.score_column - 1 if sheet.score_column is not None else None
+
+    row_styles: Dict[int, Dict[int, int]] = {}
+    for row_index in (1, 2):
+        if row_index <= len(sheet.rows):
+            row_styles[row_index] = {
+                col: HEADER_STYLE
+                for col, value in enumerate(sheet.rows[row_index - 1])
+                if value is not None and col != score_index
+            }
+    for first_row, first_col, last_row, last_col in sheet.highlight_blocks:
+        for row_index in range(first_row, last_row + 1):
+            styles = row_styles.setdefault(row_index, {})
+            for col in range(first_col - 1, last_col):
+                styles[col] = HIGHLIGHT_STYLE
+
+    empty_styles: Dict[int, int] = {}
+    for row_index, row_values in enumerate(sheet.rows, start=1):
+        styles = row_styles.get(row_index, empty_styles)
+        if score_index is not None:
+            styles = dict(styles)
+            value = row_values[score_index]
+            styles[score_index] = SCORE_TOTAL_STYLE if row_index >= 3 and value not in (None, "") else SCORE_STYLE
+        yield row_index, row_values, styles
+
+
+XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XLSX_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+XLSX_CONTENT_TYPES = (
+    XLSX_XML_HEADER
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    "</Types>"
+)
+XLSX_ROOT_RELS = (
+    XLSX_XML_HEADER
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+XLSX_WORKBOOK = (
+    XLSX_XML_HEADER
+    + f'<workbook xmlns="{XLSX_MAIN_NS}" xmlns:r="{XLSX_REL_NS}">'
+    '<sheets><sheet name="Responses" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+XLSX_WORKBOOK_RELS = (
+    XLSX_XML_HEADER
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{XLSX_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{XLSX_REL_NS}/styles" Target="styles.xml"/>'
+    f'<Relationship Id="rId3" Type="{XLSX_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+    "</Relationships>"
+)
+# cellXfs in the order of the style ids: default, header, highlighted block,
+# score, bold score.
+XLSX_STYLES = (
+    XLSX_XML_HEADER
+    + f'<styleSheet xmlns="{XLSX_MAIN_NS}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    "</fonts>"
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    f'<fill><patternFill patternType="solid"><fgColor rgb="FF{HIGHLIGHT_COLOR}"/>'
+    f'<bgColor rgb="FF{HIGHLIGHT_COLOR}"/></patternFill></fill>'
+    "</fills>"
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    '<alignment vertical="top"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="2" borderId="0" xfId="0" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="top"/></xf>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="top"/></xf>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+# Escape markup characters and drop the code points XML 1.0 forbids: C0
+# controls, U+FFFE/U+FFFF and lone surrogates, which the stdlib json parser
+# lets through for "\ud800"-style escapes. Left in, they leave a workbook
+# Excel refuses to open.
+XML_TEXT_ESCAPES: Dict[int, str | None] = {
+    **dict.fromkeys((code for code in range(32) if code not in (9, 10, 13)), None),
+    **dict.fromkeys(range(0xD800, 0xE000), None),
+    0xFFFE: None,
+    0xFFFF: None,
+    ord("&"): "&amp;",
+    ord("<"): "&lt;",
+    ord(">"): "&gt;",
+}
+
+
+# Row fragments collected before one write into the compressed sheet part.
+XML_WRITE_BATCH = 1 << 14
+# Shorter strings are cheaper inline than as a shared-string reference.
+SHARED_STRING_MIN_LENGTH = 4
+
+
+def column_letter(index: int) -> str:
+    """Convert a 1-based column number into its Excel letters (1 -> A, 27 -> AA)."""
+
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def write_sheet_xml(sheet: SheetData, output_path: Path, compresslevel: int | None = FAST_COMPRESS_LEVEL) -> None:
+    """Write the sheet as SpreadsheetML directly, without an Excel library.
+
+    The table is plain values plus five fixed looks, so the package parts are
+    constants and only the worksheet XML is generated, row by row. Answers
+    repeat a lot between respondents (departments, positions, yes/no), so
+    longer strings go to the shared-strings table and are written once.
+    """
+
+    letters = [column_letter(col) for col in range(1, len(sheet.widths) + 1)]
+    shared_strings: Dict[str, int] = {}
+
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream, zipfile.ZipFile(
+        stream, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as archive:
+        archive.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", XLSX_ROOT_RELS)
+        archive.writestr("xl/workbook.xml", XLSX_WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS)
+        archive.writestr("xl/styles.xml", XLSX_STYLES)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as part:
+            head = [XLSX_XML_HEADER, f'<worksheet xmlns="{XLSX_MAIN_NS}">']
+            widths = [
+                f'<col min="{col}" max="{col}" width="{width + 2}" customWidth="1"/>'
+                for col, width in enumerate(sheet.widths, start=1)
+                if width
+            ]
+            if widths:
+                head += ["<cols>", *widths, "</cols>"]
+            head.append("<sheetData>")
+            part.write("".join(head).encode("utf-8"))
+
+            cells: List[str] = []
+            for row_index, row_values, styles in iter_styled_rows(sheet):
+                if len(cells) >= XML_WRITE_BATCH:
+                    part.write("".join(cells).encode("utf-8"))
+                    cells.clear()
+                cells.append(f'<row r="{row_index}">')
+                for col, value in enumerate(row_values):
+                    style = styles.get(col)
+                    ref = f'r="{letters[col]}{row_index}"' + (f' s="{style}"' if style else "")
+                    if value is None:
+                        if style:
+                            cells.append(f"<c {ref}/>")
+                    elif isinstance(value, str):
+                        if len(value) >= SHARED_STRING_MIN_LENGTH:
+                            index = shared_strings.setdefault(value, len(shared_strings))
+                            cells.append(f'<c {ref} t="s"><v>{index}</v></c>')
+                            continue
+                        text = value.translate(XML_TEXT_ESCAPES)
+                        cells.append(f'<c {ref} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+                    elif isinstance(value, bool):
+                        cells.append(f'<c {ref} t="b"><v>{int(value)}</v></c>')
+                    elif isinstance(value, int) or math.isfinite(value):
+                        cells.append(f"<c {ref}><v>{value!r}</v></c>")
+                    else:
+                        cells.append(f'<c {ref} t="inlineStr"><is><t>{value}</t></is></c>')
+                cells.append("</row>")
+
+            tail = cells + ["</sheetData>"]
+            if sheet.merged_ranges:
+                tail.append(f'<mergeCells count="{len(sheet.merged_ranges)}">')
+                tail += [
+                    f'<mergeCell ref="{letters[first_col - 1]}{first_row}:{letters[last_col - 1]}{last_row}"/>'
+                    for first_row, first_col, last_row, last_col in sheet.merged_ranges
+                ]
+                tail.append("</mergeCells>")
+            tail.append("</worksheet>")
+            part.write("".join(tail).encode("utf-8"))
+
+        with archive.open("xl/sharedStrings.xml", "w", force_zip64=True) as part:
+            count = len(shared_strings)
+            items = [XLSX_XML_HEADER, f'<sst xmlns="{XLSX_MAIN_NS}" count="{count}" uniqueCount="{count}">']
+            items += [
+                f'<si><t xml:space="preserve">{text.translate(XML_TEXT_ESCAPES)}</t></si>' for text in shared_strings
+            ]
+            items.append("</sst>")
+            part.write("".join(items).encode("utf-8"))
+
+
+def write_sheet_xlsxwriter(sheet: SheetData, output_path: Path, compresslevel: int | None = None) -> None:
+    """Stream the sheet with XlsxWriter in constant-memory mode.
+
+    XlsxWriter zips at its own fixed level, so ``compresslevel`` is ignored.
+    """
+
+    require_package("xlsxwriter", "xlsxwriter")
+    import xlsxwriter
+
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+        # Answers are written as typed: no formulas out of "=..." and no
+        # hyperlinks out of URLs, same as the other engines.
+        wb = xlsxwriter.Workbook(
+            stream,
+            {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "nan_inf_to_errors": True,
+            },
+        )
+        ws = wb.add_worksheet("Responses")
+        formats = {
+            HEADER_STYLE: wb.add_format({"valign": "top"}),
+            HIGHLIGHT_STYLE: wb.add_format({"bg_color": f"#{HIGHLIGHT_COLOR}", "pattern": 1}),
+            SCORE_STYLE: wb.add_format({"align": "left", "valign": "top"}),
+            SCORE_TOTAL_STYLE: wb.add_format({"bold": True, "align": "left", "valign": "top"}),
+        }
+
+        for col, width in enumerate(sheet.widths):
+            if width:
+                ws.set_column(col, col, width + 2)
+
+        # Constant-memory mode flushes a row as soon as a later one is touched,
+        # so each merge is registered while its first row is the current one.
+        # Without a format merge_range() leaves the rest of the range alone.
+        merges_by_row: Dict[int, List[Tuple[int, int, int, int]]] = {}
+        for merged in sheet.merged_ranges:
+            # XlsxWriter refuses one-cell "merges", which change nothing anyway.
+            if merged[:2] != merged[2:]:
+                merges_by_row.setdefault(merged[0], []).append(merged)
+
+        for row_index, row_values, styles in iter_styled_rows(sheet):
+            row = row_index - 1
+            for first_row, first_col, last_row, last_col in merges_by_row.get(row_index, ()):
+                ws.merge_range(first_row - 1, first_col - 1, last_row - 1, last_col - 1, None)
+            for col, value in enumerate(row_values):
+                cell_format = formats.get(styles.get(col, DEFAULT_STYLE))
+                if value is None or value == "":
+                    if cell_format is not None:
+                        ws.write_blank(row, col, None, cell_format)
+                elif isinstance(value, str):
+                    ws.write_string(row, col, value, cell_format)
+                elif isinstance(value, bool):
+                    ws.write_boolean(row, col, value, cell_format)
+                else:
+                    ws.write_number(row, col, value, cell_format)
 
-    wb.save(output_path)
+        wb.close()
 
 
-def merge_json_directory(input_dir: Path, output_path: Path, generate_pdfs: bool = False) -> int:
+WORKBOOK_ENGINES = {
+    "openpyxl": write_sheet_openpyxl,
+    "pyexcelerate": write_sheet_pyexcelerate,
+    "xlsxwriter": write_sheet_xlsxwriter,
+    "xml": write_sheet_xml,
+}
+
+
+# The built-in XML writer needs no third-party package and is the fastest;
+# the library engines stay available for comparison and as a fallback.
+DEFAULT_WORKBOOK_ENGINE = "xml"
+
+
+def write_workbook(
+    records: List[Tuple[Path, JsonRecord]],
+    questions: List[QuestionColumn],
+    output_path: Path,
+    engine: str | None = None,
+    auto_width: bool = True,
+    fast_compress: bool = True,
+) -> None:
+    sheet = build_sheet(records, questions, auto_width=auto_width)
+    compresslevel = FAST_COMPRESS_LEVEL if fast_compress else None
+    WORKBOOK_ENGINES[engine or DEFAULT_WORKBOOK_ENGINE](sheet, output_path, compresslevel=compresslevel)
+
+
+def merge_json_directory(
+    input_dir: Path,
+    output_path: Path,
+    generate_pdfs: bool = False,
+    engine: str | None = None,
+    auto_width: bool = True,
+    fast_compress: bool = True,
+) -> int:
     """Merge JSON files from a directory into an Excel workbook."""
 
     records = load_json_files(input_dir)
     questions = determine_columns(records)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    write_workbook(records, questions, output_path)
+    write_workbook(
+        records,
+        questions,
+        output_path,
+        engine=engine,
+        auto_width=auto_width,
+        fast_compress=fast_compress,
+    )
     if generate_pdfs:
         generate_score_reports(records, output_path.parent)
     return len(records)
@@ -778,7 +1374,7 @@ def launch_gui() -> None:
     root.configure(bg="#0c0f16")
     root.resizable(False, False)
 
-    icon_path = ensure_icon_path()
+    icon_path = get_resource_path("combine_json_to_excel.ico")
     if icon_path.exists():
         try:
             root.iconbitmap(default=str(icon_path))
@@ -972,11 +1568,21 @@ def launch_gui() -> None:
 def main() -> None:
     if len(sys.argv) > 1:
         args = parse_args()
-        merged = merge_json_directory(args.input_dir, args.output, generate_pdfs=args.generate_pdf)
+        merged = merge_json_directory(
+            args.input_dir,
+            args.output,
+            generate_pdfs=args.generate_pdf,
+            engine=args.engine,
+            auto_width=args.auto_width,
+            fast_compress=args.fast_compress,
+        )
         print(f"Merged {merged} JSON files into {args.output}")
     else:
         launch_gui()
 
 
 if __name__ == "__main__":
+    # Lets the worker processes of generate_score_reports start correctly
+    # from the PyInstaller-built executable.
+    multiprocessing.freeze_support()
     main()
@@ -1,80 +0,0 @@
-"""Embedded application icon (base64-encoded ICO)."""
-
-ICON_BASE64 = (
-    "AAABAAEAICAAAAEAIACoEAAAFgAAACgAAAAgAAAAQAAAAAEAIAAAAAAAgBAAABMLAAATCwAAAAAA"
-    "AAAAAADMgjT/zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/"
-    "zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/zII0/8yCNP/MgjT/zII0/8yCNP/M"
-    "gjT/zII0/8yCNP/MgjT/zII0/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/"
-    "M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z"
-    "/8h/M//IfzP/yH8z/8h/M//IfzP/yH8z/8h/M//IfzP/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/"
-    "xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/F"
-    "fTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/FfTL/xX0y/8V9Mv/CezH/wnsx/8J7"
-    "Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/gNf/"
-    "/8J7Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/wnsx/8J7Mf/CezH/"
-    "wnsx/795MP+/eTD/v3kw/795MP+/eTD/v3kw/795MP+/eTD/v3kw/795MP+/eTD/v3kw/4DX//+A"
-    "1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//795MP+/eTD/v3kw/795MP+/eTD/v3kw/795"
-    "MP+/eTD/v3kw/795MP+/eTD/vHcv/7x3L/+8dy//vHcv/7x3L/+8dy//vHcv/7x3L/+8dy//vHcv"
-    "/4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+8dy//"
-    "vHcv/7x3L/+8dy//vHcv/7x3L/+8dy//vHcv/7x3L/+5dS7/uXUu/7l1Lv+5dS7/uXUu/7l1Lv+5"
-    "dS7/uXUu/7l1Lv+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX"
-    "//+A1///gNf//4DX//+5dS7/uXUu/7l1Lv+5dS7/uXUu/7l1Lv+5dS7/uXUu/7ZzLv+2cy7/tnMu"
-    "/7ZzLv+2cy7/tnMu/7ZzLv+2cy7/gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///"
-    "gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+2cy7/tnMu/7ZzLv+2cy7/tnMu/7ZzLv+2"
-    "cy7/s3Et/7NxLf+zcS3/s3Et/7NxLf+zcS3/s3Et/4DX//+A1///gNf//4DX//+A1///gNf//7Nx"
-    "Lf+zcS3/s3Et/7NxLf+zcS3/s3Et/7NxLf+A1///gNf//4DX//+A1///gNf//4DX//+zcS3/s3Et"
-    "/7NxLf+zcS3/s3Et/7NxLf+wbyz/sG8s/7BvLP+wbyz/sG8s/7BvLP+A1///gNf//4DX//+A1///"
-    "gNf//4DX//+A1///sG8s/7BvLP+wbyz/sG8s/7BvLP+wbyz/sG8s/4DX//+A1///gNf//4DX//+A"
-    "1///gNf//4DX//+wbyz/sG8s/7BvLP+wbyz/sG8s/61tK/+tbSv/rW0r/61tK/+tbSv/rW0r/4DX"
-    "//+A1///gNf//4DX//+tbSv/rW0r/61tK/+tbSv/rW0r/61tK/+tbSv/rW0r/61tK/+tbSv/rW0r"
-    "/61tK/+tbSv/gNf//4DX//+A1///gNf//61tK/+tbSv/rW0r/61tK/+tbSv/qmoq/6pqKv+qair/"
-    "qmoq/6pqKv+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//6pqKv+qair/qmoq/6pqKv+q"
-    "air/qmoq/6pqKv+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//6pqKv+qair/qmoq/6pq"
-    "Kv+naCn/p2gp/6doKf+naCn/p2gp/4DX//+A1///gNf//4DX//+naCn/p2gp/6doKf+naCn/p2gp"
-    "/6doKf+naCn/p2gp/6doKf+naCn/p2gp/6doKf+naCn/p2gp/6doKf+A1///gNf//4DX//+A1///"
-    "p2gp/6doKf+naCn/p2gp/6RmKf+kZin/pGYp/6RmKf+kZin/gNf//4DX//+A1///gNf//4DX//+A"
-    "1///gNf//4DX//+kZin/pGYp/6RmKf+kZin/pGYp/6RmKf+kZin/gNf//4DX//+A1///gNf//4DX"
-    "//+A1///gNf//4DX//+kZin/pGYp/6RmKf+kZin/oWQo/6FkKP+hZCj/oWQo/6FkKP+A1///gNf/"
-    "/4DX//+A1///oWQo/6FkKP+hZCj/oWQo/6FkKP+hZCj/oWQo/6FkKP+hZCj/oWQo/6FkKP+hZCj/"
-    "oWQo/6FkKP+hZCj/gNf//4DX//+A1///gNf//6FkKP+hZCj/oWQo/6FkKP+eYif/nmIn/55iJ/+e"
-    "Yif/gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///nmIn/55iJ/+eYif/nmIn/55i"
-    "J/+eYif/nmIn/4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//55iJ/+eYif/nmIn"
-    "/5tgJv+bYCb/m2Am/5tgJv+bYCb/gNf//4DX//+A1///gNf//5tgJv+bYCb/m2Am/5tgJv+bYCb/"
-    "m2Am/5tgJv+bYCb/m2Am/5tgJv+bYCb/m2Am/5tgJv+bYCb/m2Am/4DX//+A1///gNf//4DX//+b"
-    "YCb/m2Am/5tgJv+bYCb/mF4l/5heJf+YXiX/mF4l/5heJf+A1///gNf//4DX//+A1///gNf//4DX"
-    "//+A1///gNf//5heJf+YXiX/mF4l/5heJf+YXiX/mF4l/5heJf+A1///gNf//4DX//+A1///gNf/"
-    "/4DX//+A1///gNf//5heJf+YXiX/mF4l/5heJf+VXCT/lVwk/5VcJP+VXCT/lVwk/4DX//+A1///"
-    "gNf//4DX//+VXCT/lVwk/5VcJP+VXCT/lVwk/5VcJP+VXCT/lVwk/5VcJP+VXCT/lVwk/5VcJP+V"
-    "XCT/lVwk/5VcJP+A1///gNf//4DX//+A1///lVwk/5VcJP+VXCT/lVwk/5JaJP+SWiT/klok/5Ja"
-    "JP+SWiT/gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+SWiT/klok/5JaJP+SWiT/klok"
-    "/5JaJP+SWiT/gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+SWiT/klok/5JaJP+SWiT/"
-    "j1gj/49YI/+PWCP/j1gj/49YI/+PWCP/gNf//4DX//+A1///gNf//49YI/+PWCP/j1gj/49YI/+P"
-    "WCP/j1gj/49YI/+PWCP/j1gj/49YI/+PWCP/j1gj/49YI/+A1///gNf//4DX//+A1///j1gj/49Y"
-    "I/+PWCP/j1gj/49YI/+MVSL/jFUi/4xVIv+MVSL/jFUi/4xVIv+A1///gNf//4DX//+A1///gNf/"
-    "/4DX//+A1///jFUi/4xVIv+MVSL/jFUi/4xVIv+MVSL/jFUi/4DX//+A1///gNf//4DX//+A1///"
-    "gNf//4DX//+MVSL/jFUi/4xVIv+MVSL/jFUi/4lTIf+JUyH/iVMh/4lTIf+JUyH/iVMh/4lTIf+A"
-    "1///gNf//4DX//+A1///gNf//4DX//+JUyH/iVMh/4lTIf+JUyH/iVMh/4lTIf+JUyH/gNf//4DX"
-    "//+A1///gNf//4DX//+A1///iVMh/4lTIf+JUyH/iVMh/4lTIf+JUyH/hlEg/4ZRIP+GUSD/hlEg"
-    "/4ZRIP+GUSD/hlEg/4ZRIP+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///"
-    "gNf//4DX//+A1///gNf//4DX//+A1///gNf//4ZRIP+GUSD/hlEg/4ZRIP+GUSD/hlEg/4ZRIP+D"
-    "Tx//g08f/4NPH/+DTx//g08f/4NPH/+DTx//g08f/4NPH/+A1///gNf//4DX//+A1///gNf//4DX"
-    "//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+DTx//g08f/4NPH/+DTx//g08f"
-    "/4NPH/+DTx//g08f/4BNH/+ATR//gE0f/4BNH/+ATR//gE0f/4BNH/+ATR//gE0f/4BNH/+A1///"
-    "gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///gE0f/4BNH/+A"
-    "TR//gE0f/4BNH/+ATR//gE0f/4BNH/+ATR//fUse/31LHv99Sx7/fUse/31LHv99Sx7/fUse/31L"
-    "Hv99Sx7/fUse/31LHv99Sx7/gNf//4DX//+A1///gNf//4DX//+A1///gNf//4DX//+A1///fUse"
-    "/31LHv99Sx7/fUse/31LHv99Sx7/fUse/31LHv99Sx7/fUse/31LHv96SR3/ekkd/3pJHf96SR3/"
-    "ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/gNf//3pJHf96"
-    "SR3/ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/ekkd/3pJHf96SR3/ekkd/3dH"
-    "HP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc"
-    "/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/d0cc/3dHHP93Rxz/"
-    "d0cc/3dHHP93Rxz/dEUb/3RFG/90RRv/dEUb/3RFG/90RRv/dEUb/3RFG/90RRv/dEUb/3RFG/90"
-    "RRv/dEUb/3RFG/90RRv/dEUb/3RFG/90RRv/dEUb/3RFG/90RRv/dEUb/3RFG/90RRv/dEUb/3RF"
-    "G/90RRv/dEUb/3RFG/90RRv/dEUb/3RFG/9xQxr/cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa"
-    "/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/"
-    "cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa/3FDGv9xQxr/cUMa/25BGv9uQRr/bkEa/25BGv9u"
-    "QRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/bkEa/25B"
-    "Gv9uQRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/bkEa/25BGv9uQRr/AAAA"
-    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
-    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
-    "AAAAAAAAAAAAAAA="
-)
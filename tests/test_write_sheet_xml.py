@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+import combine_json_to_excel as combine
+
+MAIN_NS = {"m": combine.XLSX_MAIN_NS}
+
+
+def read_sheet_texts(path: Path) -> list[str]:
+    """Parse the written package and return every string cell's text."""
+
+    with zipfile.ZipFile(path) as archive:
+        shared = ElementTree.fromstring(archive.read("xl/sharedStrings.xml"))
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    shared_texts = [item.findtext("m:t", default="", namespaces=MAIN_NS) for item in shared]
+
+    texts = []
+    for cell in sheet.iterfind(".//m:c", MAIN_NS):
+        if cell.get("t") == "s":
+            texts.append(shared_texts[int(cell.findtext("m:v", namespaces=MAIN_NS))])
+        elif cell.get("t") == "inlineStr":
+            texts.append(cell.findtext("m:is/m:t", default="", namespaces=MAIN_NS))
+    return texts
+
+
+class WriteSheetXmlTest(unittest.TestCase):
+    def write(self, answers: dict) -> list[str]:
+        records = [(Path("answer.json"), answers)]
+        sheet = combine.build_sheet(records, combine.determine_columns(records))
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = Path(tmp) / "combined.xlsx"
+            combine.write_sheet_xml(sheet, output_path)
+            return read_sheet_texts(output_path)
+
+    def test_characters_forbidden_in_xml_are_dropped(self):
+        texts = self.write({"full_name": "Иван\ufffeов", "department": "a\uffff\ud800b\x01c"})
+
+        self.assertIn("Иванов", texts)
+        self.assertIn("abc", texts)
+
+    def test_markup_characters_round_trip(self):
+        texts = self.write({"full_name": "<Иванов & Ко>", "department": "ab"})
+
+        self.assertIn("<Иванов & Ко>", texts)
+        self.assertIn("ab", texts)
+
+
+if __name__ == "__main__":
+    unittest.main()